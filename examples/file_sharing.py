@@ -8,10 +8,7 @@ This example demonstrates how to use the File Sharing features of the SDK:
 """
 
 import asyncio
-import contextlib
 import os
-import tempfile
-from pathlib import Path
 
 from see import SeeClient
 
@@ -30,32 +27,29 @@ async def main() -> None:
         domains = await client.get_file_domains()
         print(f"Available file domains: {domains.data}")
 
-        # Create a dummy file for demonstration
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp:
-            tmp.write("This is a test file uploaded via SEE Python SDK.")
-            tmp_path = tmp.name
+        # Upload in-memory content; a file path works the same way
+        content = b"This is a test file uploaded via SEE Python SDK."
 
-        try:
-            # 2. Upload the file
-            print(f"\nUploading file: {tmp_path}")
-            uploaded = await client.upload_file(tmp_path)
+        # 2. Upload the file
+        print("\nUploading file: test.txt")
+        uploaded = await client.upload_file(content, filename="test.txt")
 
-            print("Upload successful!")
-            print(f"URL: {uploaded.url}")
-            print(f"Hash: {uploaded.hash}")
-            print(f"Size: {uploaded.size} bytes")
+        print("Upload successful!")
+        print(f"URL: {uploaded.url}")
+        print(f"Hash: {uploaded.hash}")
+        print(f"Size: {uploaded.size} bytes")
 
-            # 3. Delete the file
-            if uploaded.hash:
-                print(f"\nDeleting file with hash: {uploaded.hash}")
-                deleted = await client.delete_file(uploaded.hash)
-                print(f"Delete status: {deleted.code} - {deleted.message}")
-
-        finally:
-            # Cleanup temporary file
-            with contextlib.suppress(OSError):
-                Path(tmp_path).unlink()
+        # 3. Delete the file
+        if uploaded.hash:
+            print(f"\nDeleting file with hash: {uploaded.hash}")
+            deleted = await client.delete_file(uploaded.hash)
+            print(f"Delete status: {deleted.code} - {deleted.message}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional, faster event loop: pip install 'see-sdk[uvloop]'
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -10,7 +10,6 @@ This example demonstrates how to use the Text Sharing features of the SDK:
 
 import asyncio
 import os
-from urllib.parse import urlparse
 
 from see import SeeClient
 from see.models import (
@@ -50,7 +49,8 @@ async def main() -> None:
 
         # 3. Update the text
         if created.short_url and created.slug:
-            domain = urlparse(created.short_url).netloc
+            # short_url is always "scheme://domain/slug"
+            domain = created.short_url.split("/", 3)[2]
             print(f"\nUpdating text (slug: {created.slug}, domain: {domain})...")
 
             update_req = UpdateTextRequest(
@@ -72,4 +72,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional, faster event loop: pip install 'see-sdk[uvloop]'
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -40,4 +40,9 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional, faster event loop: pip install 'see-sdk[uvloop]'
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -5,17 +5,22 @@ This package provides a clean and type-safe interface for interacting
 with SEE services to manage Short URLs, Text, Files, and more.
 """
 
-from .client import SeeClient
-from .exceptions import (
-    APIError,
-    AuthenticationError,
-    NotFoundError,
-    RateLimitError,
-    SeeError,
-    ValidationError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .client import SeeClient
+    from .exceptions import (
+        APIError,
+        AuthenticationError,
+        NotFoundError,
+        RateLimitError,
+        SeeError,
+        ValidationError,
+    )
+
 __all__ = [
     "APIError",
     "AuthenticationError",
@@ -25,3 +30,28 @@ __all__ = [
     "SeeError",
     "ValidationError",
 ]
+
+# Public names are imported on first access, so `import see` stays cheap
+# and does not pull in httpx until the client is actually used.
+_LAZY_IMPORTS = {
+    "APIError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "SeeClient": ".client",
+    "SeeError": ".exceptions",
+    "ValidationError": ".exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,10 +1,29 @@
-from typing import TYPE_CHECKING
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from ..http_client import HttpClient
 
+T = TypeVar("T")
+
 
 class BaseAPI:
     """Base class for API mixins providing type hints."""
 
     _http_client: "HttpClient"
+    _domain_cache_ttl: float
+    _domain_cache: dict[str, tuple[float, Any]]
+
+    async def _get_cached(self, path: str, parse: Callable[[dict[str, Any]], T]) -> T:
+        """GET a metadata endpoint, serving repeat lookups from memory until expiry."""
+        now = time.monotonic()
+        cached = self._domain_cache.get(path)
+        if cached is not None and cached[0] > now:
+            result: T = cached[1]
+            return result
+
+        result = parse(await self._http_client.get(path))
+        if self._domain_cache_ttl > 0:
+            self._domain_cache[path] = (now + self._domain_cache_ttl, result)
+        return result
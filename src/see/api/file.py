@@ -1,5 +1,11 @@
+import asyncio
+import mimetypes
+import os
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import BinaryIO
 
+from ..exceptions import ValidationError
 from ..models import (
     DeleteFileResponse,
     DomainResponse,
@@ -7,37 +13,118 @@ from ..models import (
 )
 from .base import BaseAPI
 
+# Files up to this size are read into memory off the event loop; larger
+# files are streamed from disk in chunks so memory use stays bounded.
+STREAM_UPLOAD_THRESHOLD = 4 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# HTML5 form-data escaping for the multipart filename, as httpx does it
+_FORM_PARAM_ESCAPES = {
+    ord('"'): "%22",
+    ord("\\"): "\\\\",
+    **{c: f"%{c:02X}" for c in range(0x20) if c != 0x1B},
+}
+
+
+def _multipart_file_body(
+    path: Path, filename: str, size: int
+) -> tuple[AsyncIterator[bytes], dict[str, str]]:
+    """
+    Build a streamed multipart body holding a single ``file`` field.
+
+    The file is opened, read and closed in worker threads one chunk at a
+    time, so a large upload never blocks the event loop.
+
+    Returns:
+        The body as an async byte iterator, and the request headers for it
+    """
+    boundary = os.urandom(16).hex()
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; '
+        f'filename="{filename.translate(_FORM_PARAM_ESCAPES)}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+
+    async def body() -> AsyncIterator[bytes]:
+        yield head
+        f = await asyncio.to_thread(path.open, "rb")
+        try:
+            while chunk := await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE):
+                yield chunk
+        finally:
+            await asyncio.to_thread(f.close)
+        yield tail
+
+    headers = {
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+        "Content-Length": str(len(head) + size + len(tail)),
+    }
+    return body(), headers
+
 
 class FileAPI(BaseAPI):
     """API methods for File Sharing operations."""
 
-    async def upload_file(self, file_path: str) -> UploadFileResponse:
+    _upload_semaphore: asyncio.BoundedSemaphore
+
+    async def upload_file(
+        self,
+        file_path: str | os.PathLike[str] | bytes | BinaryIO,
+        filename: str | None = None,
+    ) -> UploadFileResponse:
         """
         Upload a file.
 
         Args:
-            file_path: Path to the file to upload
+            file_path: Path to the file to upload, or the file contents as
+                bytes or a binary file object
+            filename: Name to upload the file as; required for bytes and file
+                objects, defaults to the file name for paths
 
         Returns:
             UploadFileResponse: Response containing the uploaded file details
 
         Raises:
+            ValidationError: If filename is missing for bytes or a file object
             APIError: If the API request fails
             IOError: If the file cannot be read
         """
-        path = Path(file_path)
-        filename = path.name
-
-        with path.open("rb") as f:
-            # httpx will handle the multipart encoding by providing `files`.
-            files = {"file": (filename, f)}
-
-            response = await self._http_client.post(
-                "/v1/file/upload",
-                files=files,
-            )
+        if not isinstance(file_path, str | os.PathLike):
+            if not filename:
+                raise ValidationError(
+                    "Filename is required when uploading bytes or a file object"
+                )
+            async with self._upload_semaphore:
+                response = await self._http_client.post(
+                    "/v1/file/upload",
+                    files={"file": (filename, file_path)},
+                )
             return UploadFileResponse.from_dict(response)
 
+        path = Path(file_path)
+        filename = filename or path.name
+
+        async with self._upload_semaphore:
+            size = (await asyncio.to_thread(path.stat)).st_size
+            if size <= STREAM_UPLOAD_THRESHOLD:
+                content = await asyncio.to_thread(path.read_bytes)
+                response = await self._http_client.post(
+                    "/v1/file/upload",
+                    files={"file": (filename, content)},
+                )
+            else:
+                # httpx's own multipart encoder reads files synchronously
+                body, headers = _multipart_file_body(path, filename, size)
+                response = await self._http_client.post(
+                    "/v1/file/upload",
+                    content=body,
+                    headers=headers,
+                )
+        return UploadFileResponse.from_dict(response)
+
     async def delete_file(self, hash_str: str) -> DeleteFileResponse:
         """
         Delete a file.
@@ -65,5 +152,4 @@ class FileAPI(BaseAPI):
         Raises:
             APIError: If the API request fails
         """
-        response = await self._http_client.get("/v1/file/domains")
-        return DomainResponse.from_dict(response)
+        return await self._get_cached("/v1/file/domains", DomainResponse.from_dict)
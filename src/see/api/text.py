@@ -1,5 +1,3 @@
-from dataclasses import asdict
-
 from ..models import (
     CreateTextRequest,
     CreateTextResponse,
@@ -28,7 +26,7 @@ class TextAPI(BaseAPI):
         Raises:
             APIError: If the API request fails
         """
-        response = await self._http_client.post("/v1/text", json=asdict(request))
+        response = await self._http_client.post("/v1/text", json=request)
         return CreateTextResponse.from_dict(response)
 
     async def update_text(self, request: UpdateTextRequest) -> UpdateTextResponse:
@@ -44,7 +42,7 @@ class TextAPI(BaseAPI):
         Raises:
             APIError: If the API request fails
         """
-        response = await self._http_client.put("/v1/text", json=asdict(request))
+        response = await self._http_client.put("/v1/text", json=request)
         return UpdateTextResponse.from_dict(response)
 
     async def delete_text(self, request: DeleteTextRequest) -> DeleteTextResponse:
@@ -62,7 +60,7 @@ class TextAPI(BaseAPI):
         """
         # The API documentation says DELETE method but body is used.
         # httpx supports content/json in DELETE.
-        response = await self._http_client.delete("/v1/text", json=asdict(request))
+        response = await self._http_client.delete("/v1/text", json=request)
         return DeleteTextResponse.from_dict(response)
 
     async def get_text_domains(self) -> DomainResponse:
@@ -75,5 +73,4 @@ class TextAPI(BaseAPI):
         Raises:
             APIError: If the API request fails
         """
-        response = await self._http_client.get("/v1/text/domains")
-        return DomainResponse.from_dict(response)
+        return await self._get_cached("/v1/text/domains", DomainResponse.from_dict)
@@ -1,4 +1,5 @@
-from dataclasses import asdict
+import asyncio
+from collections.abc import Iterable
 
 from ..exceptions import ValidationError
 from ..models import (
@@ -28,21 +29,56 @@ class ShortUrlAPI(BaseAPI):
             CreateShortUrlResponse: Response containing the created short URL details
 
         Raises:
-            ValidationError: If target URL is invalid or domain is missing
             APIError: If the API request fails
         """
-        # Validate target URL format
-        if not request.target_url or not request.target_url.startswith(
-            ("http://", "https://")
-        ):
-            raise ValidationError("Invalid URL: must start with http:// or https://")
+        response = await self._http_client.post("/v1/shorten", json=request)
+        return CreateShortUrlResponse.from_dict(response)
 
-        # Validate domain is provided
-        if not request.domain:
-            raise ValidationError("Domain is required")
+    async def bulk_create_short_url(
+        self,
+        requests: Iterable[CreateShortUrlRequest],
+        concurrency: int = 32,
+    ) -> list[CreateShortUrlResponse | Exception]:
+        """
+        Create many short URLs concurrently.
 
-        response = await self._http_client.post("/v1/shorten", json=asdict(request))
-        return CreateShortUrlResponse.from_dict(response)
+        The requests share the client's pooled connections; with HTTP/2
+        enabled they are multiplexed over a single connection, so a batch
+        completes in roughly the time of its slowest request. A concurrency
+        of 8-16 per connection is a reasonable starting point for HTTP/1.1.
+
+        Args:
+            requests: The create short URL requests to send
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            list: One entry per request, in order: the CreateShortUrlResponse
+                on success, or the exception raised for that request
+
+        Raises:
+            ValidationError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(
+            request: CreateShortUrlRequest,
+        ) -> CreateShortUrlResponse | Exception:
+            # Return failures instead of raising so one bad request does not
+            # abort the rest of the batch
+            async with semaphore:
+                try:
+                    return await self.create_short_url(request)
+                except Exception as e:
+                    return e
+
+        # The TaskGroup ties every request to this call: if it is cancelled,
+        # the requests still in flight are cancelled with it
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(create(r)) for r in requests]
+        return [task.result() for task in tasks]
 
     async def update_short_url(
         self, request: UpdateShortUrlRequest
@@ -62,7 +98,7 @@ class ShortUrlAPI(BaseAPI):
         """
         response = await self._http_client.put(
             "/v1/shorten",
-            json=asdict(request),
+            json=request,
         )
         return UpdateShortUrlResponse.from_dict(response)
 
@@ -82,5 +118,5 @@ class ShortUrlAPI(BaseAPI):
             NotFoundError: If the short URL is not found
             APIError: If the API request fails
         """
-        response = await self._http_client.delete("/v1/shorten", json=asdict(request))
+        response = await self._http_client.delete("/v1/shorten", json=request)
         return DeleteShortUrlResponse.from_dict(response)
@@ -1,12 +1,13 @@
 """Main client for SEE SDK."""
 
+import asyncio
 from typing import Any
 
 from .api.file import FileAPI
 from .api.text import TextAPI
 from .api.url import ShortUrlAPI
 from .exceptions import ValidationError
-from .http_client import HttpClient
+from .http_client import HttpClient, Transport
 from .models import (
     DomainResponse,
     TagResponse,
@@ -31,6 +32,12 @@ class SeeClient(ShortUrlAPI, TextAPI, FileAPI):
             )
             response = await client.create_short_url(request)
             print(response.data)
+
+    The client can also be used without ``async with``: the connection pool
+    is opened on the first request and reused until ``aclose()`` is called.
+
+    For heavily concurrent workloads, running the event loop on uvloop
+    (``pip install 'see-sdk[uvloop]'``) is recommended.
     """
 
     def __init__(
@@ -40,6 +47,14 @@ class SeeClient(ShortUrlAPI, TextAPI, FileAPI):
         timeout: float = 30.0,
         max_retries: int = 3,
         proxy: str | None = None,
+        max_keepalive_connections: int = 20,
+        max_connections: int = 100,
+        keepalive_expiry: float = 60.0,
+        transport: Transport = "httpx",
+        domain_cache_ttl: float = 60.0,
+        max_concurrent_uploads: int = 8,
+        max_concurrent_requests: int = 64,
+        http2: bool = True,
     ) -> None:
         """
         Initialize the SEE URL client.
@@ -50,20 +65,57 @@ class SeeClient(ShortUrlAPI, TextAPI, FileAPI):
             timeout: Request timeout in seconds (default: 30.0)
             max_retries: Maximum number of retries for failed requests (default: 3)
             proxy: Optional HTTP proxy URL (e.g., http://localhost:8080)
+            max_keepalive_connections: Maximum number of idle connections kept
+                in the pool for reuse (default: 20)
+            max_connections: Maximum number of concurrent connections (default: 100)
+            keepalive_expiry: Seconds an idle pooled connection is kept open
+                (default: 60.0)
+            transport: HTTP transport backend, "httpx" or "aiohttp" (default: httpx).
+                The aiohttp backend performs better under heavy concurrency and
+                requires the ``see-sdk[aiohttp]`` extra
+            domain_cache_ttl: Seconds to cache domain and tag lookups for,
+                0 disables caching (default: 60.0)
+            max_concurrent_uploads: Maximum number of files read and uploaded
+                at the same time (default: 8)
+            max_concurrent_requests: Maximum number of requests in flight at
+                the same time; extra calls wait for a free slot (default: 64)
+            http2: Multiplex concurrent requests over a single HTTP/2 connection
+                (default: True). Only used by the httpx transport, since aiohttp
+                speaks HTTP/1.1; pick httpx + HTTP/2 for many requests to one
+                host and aiohttp for lower per-connection overhead
 
         Raises:
-            ValidationError: If API key is empty or invalid
+            ValidationError: If API key is empty or invalid, or a concurrency
+                limit is less than 1
         """
         if not api_key:
             raise ValidationError("API key is required")
 
+        if transport not in ("httpx", "aiohttp"):
+            raise ValidationError(f"Unsupported transport: {transport}")
+
+        if max_concurrent_requests < 1:
+            raise ValidationError("max_concurrent_requests must be at least 1")
+
+        if max_concurrent_uploads < 1:
+            raise ValidationError("max_concurrent_uploads must be at least 1")
+
         self._http_client = HttpClient(
             base_url=base_url,
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
             proxy=proxy,
+            max_keepalive_connections=max_keepalive_connections,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+            transport=transport,
+            max_concurrent_requests=max_concurrent_requests,
+            http2=http2,
         )
+        self._domain_cache_ttl = domain_cache_ttl
+        self._domain_cache = {}
+        self._upload_semaphore = asyncio.BoundedSemaphore(max_concurrent_uploads)
 
     async def __aenter__(self) -> "SeeClient":
         """Async context manager entry."""
@@ -74,6 +126,10 @@ class SeeClient(ShortUrlAPI, TextAPI, FileAPI):
         """Async context manager exit."""
         await self._http_client.__aexit__(*args)
 
+    async def aclose(self) -> None:
+        """Close the client's connection pool."""
+        await self._http_client.aclose()
+
     async def get_domains(self) -> DomainResponse:
         """
         Get available domains for creating short URLs.
@@ -84,8 +140,7 @@ class SeeClient(ShortUrlAPI, TextAPI, FileAPI):
         Raises:
             APIError: If the API request fails
         """
-        response = await self._http_client.get("/v1/domains")
-        return DomainResponse.from_dict(response)
+        return await self._get_cached("/v1/domains", DomainResponse.from_dict)
 
     async def get_tags(self) -> TagResponse:
         """
@@ -97,5 +152,4 @@ class SeeClient(ShortUrlAPI, TextAPI, FileAPI):
         Raises:
             APIError: If the API request fails
         """
-        response = await self._http_client.get("/v1/tags")
-        return TagResponse.from_dict(response)
+        return await self._get_cached("/v1/tags", TagResponse.from_dict)
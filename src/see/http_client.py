@@ -1,16 +1,75 @@
 """HTTP client wrapper for SEE URL SDK."""
 
 import asyncio
-from typing import Any, cast
-from urllib.parse import urljoin
+import dataclasses
+import functools
+import json
+import random
+from collections.abc import Callable
+from typing import Any, Literal
 
 import httpx
 
 from .exceptions import (
     APIError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
 )
+from .models.base import RequestModel
 from .version import __version__
 
+# Idle pooled connections are kept around long enough to be reused across
+# bursts of calls instead of paying a fresh TCP + TLS handshake each time.
+KEEPALIVE_EXPIRY = 60.0
+
+Transport = Literal["httpx", "aiohttp"]
+
+# How long the aiohttp transport caches resolved host addresses, in seconds
+DNS_CACHE_TTL = 300
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+OK_STATUS_CODES = frozenset({200, 201, 204})
+# Responses worth retrying: the server is overloaded or briefly unavailable
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Methods that can be safely repeated after the request may have been sent
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+BACKOFF_CAP = 30.0
+# Up to this fraction of the delay is added at random so that concurrent
+# callers failing together do not all retry at the same instant
+BACKOFF_JITTER = 0.25
+_BACKOFF = tuple(min(BACKOFF_CAP, 2.0**attempt) for attempt in range(16))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize ``obj``, which may be a request dataclass, to JSON bytes."""
+    return json.dumps(obj, separators=(",", ":"), default=_asdict).encode()
+
+
+def _asdict(obj: Any) -> Any:
+    """Convert request dataclasses for the stdlib encoder."""
+    if isinstance(obj, RequestModel):
+        return obj.to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON ``data``."""
+    return json.loads(data)
+
+
+# orjson is an optional speedup; it serializes dataclasses natively
+_dumps: Callable[[Any], bytes]
+_loads: Callable[[bytes], Any]
+try:
+    import orjson
+except ImportError:
+    _dumps, _loads = _json_dumps, _json_loads
+else:
+    _dumps, _loads = orjson.dumps, orjson.loads
+
 
 class HttpClient:
     """Async HTTP client for API requests."""
@@ -22,105 +81,239 @@ class HttpClient:
         timeout: float = 30.0,
         max_retries: int = 3,
         proxy: str | None = None,
+        max_keepalive_connections: int = 20,
+        max_connections: int = 100,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        transport: Transport = "httpx",
+        max_concurrent_requests: int = 64,
+        http2: bool = True,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.proxy = proxy
+        self.limits = httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections,
+            max_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.transport = transport
+        self.http2 = http2
+        # Everything the pooled client is built from is fixed at construction,
+        # so reopening after aclose() only has to instantiate httpx.AsyncClient
+        self._client_kwargs: dict[str, Any] = {
+            "timeout": timeout,
+            "limits": self.limits,
+            "headers": httpx.Headers(
+                {
+                    "Authorization": api_key,
+                    "User-Agent": f"see-python-sdk/{__version__}",
+                }
+            ),
+        }
+        if transport == "httpx":
+            # aiohttp only speaks HTTP/1.1, so HTTP/2 applies to httpx alone
+            self._client_kwargs["http2"] = http2
+            if proxy:
+                self._client_kwargs["proxy"] = proxy
+        self._base_url_prefix = f"{self.base_url}/"
+        self._semaphore = asyncio.BoundedSemaphore(max_concurrent_requests)
+        # The SDK only talks to a handful of endpoints, so each URL is parsed once
+        self._get_url = functools.lru_cache(maxsize=64)(self._build_url)
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> "HttpClient":
         """Async context manager entry."""
-        client_kwargs: dict[str, Any] = {
-            "timeout": self.timeout,
-            "headers": {
-                "Authorization": self.api_key,
-                "User-Agent": f"see-python-sdk/{__version__}",
-            },
-        }
-        if self.proxy:
-            client_kwargs["proxy"] = self.proxy
-
-        self._client = httpx.AsyncClient(**client_kwargs)
+        if self._client is None:
+            self._client = self._build_client()
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool; a later request reopens it."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create the pooled httpx client shared by all requests."""
+        if self.transport == "aiohttp":
+            # The transport owns an aiohttp session, so each client needs its own
+            return httpx.AsyncClient(
+                **self._client_kwargs, transport=self._build_aiohttp_transport()
+            )
+        return httpx.AsyncClient(**self._client_kwargs)
+
+    def _build_aiohttp_transport(self) -> httpx.AsyncBaseTransport:
+        """Build an httpx transport backed by a shared aiohttp session."""
+        try:
+            import aiohttp
+            from httpx_aiohttp import AiohttpTransport
+        except ImportError as e:
+            raise ImportError(
+                "The aiohttp transport requires the 'aiohttp' extra: "
+                "pip install 'see-sdk[aiohttp]'"
+            ) from e
 
-    def _get_url(self, path: str) -> str:
+        limits = self.limits
+
+        def create_session() -> aiohttp.ClientSession:
+            # Created lazily on the first request so the session is bound to
+            # the running event loop; closed together with the httpx client.
+            connector = aiohttp.TCPConnector(
+                limit=limits.max_connections or 0,
+                keepalive_timeout=limits.keepalive_expiry,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+            return aiohttp.ClientSession(connector=connector)
+
+        return AiohttpTransport(
+            limits=limits,
+            proxy=httpx.Proxy(self.proxy) if self.proxy else None,
+            client=create_session,
+        )
+
+    def _build_url(self, path: str) -> httpx.URL:
         """Construct full URL from path."""
-        return urljoin(f"{self.base_url}/", path.lstrip("/"))
+        return httpx.URL(self._base_url_prefix + path.lstrip("/"))
 
-    def _handle_response(self, response: httpx.Response) -> Any:
+    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Handle API response and raise appropriate exceptions."""
+        status_code = response.status_code
+        ok = status_code in OK_STATUS_CODES
+        body = response.content
+        if ok and not body:
+            # A 204 or otherwise empty success has no payload to decode
+            return {}
+
         try:
-            data = response.json()
-        except Exception:
+            data: dict[str, Any] = _loads(body)
+        except ValueError:
             data = {"content": response.text}
 
-        if response.status_code in (200, 201):
+        if ok:
             return data
 
-        raise APIError(
-            message=f"API request failed: {response.status_code}",
-            status_code=response.status_code,
-            response_data=data,
-        )
+        message = f"API request failed: {status_code}"
+        if status_code in (401, 403):
+            raise AuthenticationError(message, status_code, data)
+        if status_code == 404:
+            raise NotFoundError(message, status_code, data)
+        if status_code == 429:
+            raise RateLimitError(
+                message,
+                retry_after=_retry_after(response),
+                status_code=status_code,
+                response_data=data,
+            )
+        raise APIError(message, status_code, data)
 
     async def request(
         self,
         method: str,
         path: str,
         **kwargs: Any,
-    ) -> Any:
-        """Make an HTTP request with retry logic."""
-        if not self._client:
-            raise RuntimeError("HttpClient must be used as async context manager")
-
-        # Set default Content-Type to application/json if not present and not uploading files
-        if "files" not in kwargs:
-            headers = kwargs.get("headers", {})
-            if "Content-Type" not in headers:
-                if "headers" not in kwargs:
-                    kwargs["headers"] = {}
-                kwargs["headers"]["Content-Type"] = "application/json"
+    ) -> dict[str, Any]:
+        """
+        Make an HTTP request with retry logic.
+
+        Connection failures are retried for every method, since the request
+        never reached the server. Other transport errors and 429/5xx responses
+        are only retried for idempotent methods, so a POST is never repeated
+        after the server may have acted on it. A Retry-After longer than
+        BACKOFF_CAP is not waited out; the mapped error is raised instead.
+        """
+        if self._client is None:
+            self._client = self._build_client()
+
+        # Encode JSON bodies ourselves so the faster orjson encoder is used.
+        # Content-Type is only set here, not as a client default, because a
+        # default header would override the multipart type of file uploads.
+        if "json" in kwargs:
+            kwargs["content"] = _dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**JSON_HEADERS, **kwargs.get("headers", {})}
+
+        idempotent = method in IDEMPOTENT_METHODS
 
         url = self._get_url(path)
+        # Look these up once per call rather than on every attempt
+        send = self._client.request
+        semaphore = self._semaphore
+        max_retries = self.max_retries
         last_exception: Exception | None = None
 
-        for attempt in range(self.max_retries):
+        for attempt in range(max_retries):
+            can_retry = attempt < max_retries - 1
             try:
-                response = await self._client.request(method, url, **kwargs)
-                return self._handle_response(response)
-            except (httpx.TimeoutException, httpx.ConnectError) as e:
+                async with semaphore:
+                    response = await send(method, url, **kwargs)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                last_exception = e
+            except httpx.TransportError as e:
+                if not idempotent:
+                    raise APIError(f"HTTP error occurred: {e}") from e
                 last_exception = e
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2**attempt)  # Exponential backoff
-                continue
-            except APIError:
-                raise
             except httpx.HTTPError as e:
                 raise APIError(f"HTTP error occurred: {e}") from e
+            else:
+                if (
+                    can_retry
+                    and idempotent
+                    and response.status_code in RETRY_STATUS_CODES
+                ):
+                    retry_after = _retry_after(response)
+                    if retry_after is None or retry_after <= BACKOFF_CAP:
+                        await asyncio.sleep(_backoff_delay(attempt, retry_after))
+                        continue
+                return self._handle_response(response)
+
+            if can_retry:
+                await asyncio.sleep(_backoff_delay(attempt))
 
         raise APIError(
-            f"Request failed after {self.max_retries} attempts: {last_exception}"
+            f"Request failed after {max_retries} attempts: {last_exception}"
         ) from last_exception
 
     async def get(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Make a GET request."""
-        return cast(dict[str, Any], await self.request("GET", path, **kwargs))
+        return await self.request("GET", path, **kwargs)
 
     async def post(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Make a POST request."""
-        return cast(dict[str, Any], await self.request("POST", path, **kwargs))
+        return await self.request("POST", path, **kwargs)
 
     async def put(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Make a PUT request."""
-        return cast(dict[str, Any], await self.request("PUT", path, **kwargs))
+        return await self.request("PUT", path, **kwargs)
 
     async def delete(self, path: str, **kwargs: Any) -> dict[str, Any]:
         """Make a DELETE request."""
-        return cast(dict[str, Any], await self.request("DELETE", path, **kwargs))
+        return await self.request("DELETE", path, **kwargs)
+
+
+def _retry_after(response: httpx.Response) -> int | None:
+    """Return the Retry-After delay in seconds, if the server sent one.
+
+    Only the RFC 9110 delta-seconds form (ASCII digits) is understood; dates
+    and malformed values such as ``-1``, ``1.5`` or ``inf`` count as absent.
+    """
+    value = response.headers.get("Retry-After", "").strip()
+    if not (value.isascii() and value.isdigit()):
+        return None
+    try:
+        return int(value)
+    except ValueError:  # longer than int() will convert
+        return None
+
+
+def _backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Return how long to wait before retrying after ``attempt`` failed."""
+    if retry_after is not None:
+        return retry_after
+    delay = _BACKOFF[attempt] if attempt < len(_BACKOFF) else BACKOFF_CAP
+    return delay + random.uniform(0, BACKOFF_JITTER * delay)
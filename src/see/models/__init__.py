@@ -1,4 +1,8 @@
-"""Data models for SEE SDK."""
+"""Data models for SEE SDK.
+
+The concrete models are final: API methods always return instances of
+exactly these classes, so ``type(response) is CreateShortUrlResponse`` holds.
+"""
 
 from .common import DomainResponse, Tag, TagResponse
 from .file import DeleteFileResponse, UploadFileResponse
@@ -0,0 +1,57 @@
+"""Shared bases for SEE SDK models."""
+
+import dataclasses
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar, Self
+
+
+class RequestModel:
+    """Base for request dataclasses that are sent as JSON bodies."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the request payload as a plain dictionary.
+
+        Unlike ``dataclasses.asdict`` this does not deep-copy field values.
+        The method is generated from the dataclass fields on first use and
+        cached on the class.
+        """
+        cls = type(self)
+        to_dict = _make_to_dict(cls)
+        cls.to_dict = to_dict  # type: ignore[method-assign, assignment]
+        return to_dict(self)
+
+
+class CodeDataMessageResponse:
+    """Base for response dataclasses shaped as ``code``/``data``/``message``."""
+
+    __slots__ = ()
+
+    # Builds the value used when the response has no (or a null) data payload
+    _empty_data: ClassVar[Callable[[], Any]] = dict
+
+    if TYPE_CHECKING:
+
+        def __init__(self, code: int, data: Any, message: str) -> None: ...
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        """Create a response instance from a dictionary."""
+        g = data.get
+        return cls(
+            code=g("code", 0),
+            data=g("data") or cls._empty_data(),
+            message=g("message", ""),
+        )
+
+
+def _make_to_dict(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Compile a ``to_dict`` that reads each field of ``cls`` directly."""
+    items = ", ".join(f"{f.name!r}: self.{f.name}" for f in dataclasses.fields(cls))
+    namespace: dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)
+    to_dict: Callable[[Any], dict[str, Any]] = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = RequestModel.to_dict.__doc__
+    return to_dict
@@ -1,28 +1,23 @@
 """Common data models for SEE URL SDK."""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, final
 
+from .base import CodeDataMessageResponse
 
-@dataclass(frozen=True)
-class DomainResponse:
+
+@final
+@dataclass(frozen=True, slots=True)
+class DomainResponse(CodeDataMessageResponse):
     """Represents a response payload containing available domains."""
 
     code: int
     data: dict[str, list[str]]
     message: str
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "DomainResponse":
-        """Create a DomainResponse instance from a dictionary."""
-        return cls(
-            code=data.get("code", 0),
-            data=data.get("data", {}),
-            message=data.get("message", ""),
-        )
-
 
-@dataclass(frozen=True)
+@final
+@dataclass(frozen=True, slots=True)
 class Tag:
     """Represents a tag model."""
 
@@ -38,19 +33,11 @@ class Tag:
         )
 
 
-@dataclass(frozen=True)
-class TagResponse:
+@final
+@dataclass(frozen=True, slots=True)
+class TagResponse(CodeDataMessageResponse):
     """Represents a response payload containing tags."""
 
     code: int
     data: dict[str, list[dict[str, Any]]]
     message: str
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "TagResponse":
-        """Create a TagResponse instance from a dictionary."""
-        return cls(
-            code=data.get("code", 0),
-            data=data.get("data", {}),
-            message=data.get("message", ""),
-        )
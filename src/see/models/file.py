@@ -1,10 +1,11 @@
 """Data models for File Sharing operations."""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, final
 
 
-@dataclass(frozen=True)
+@final
+@dataclass(frozen=True, slots=True)
 class UploadFileResponse:
     """Represents a response payload from uploading a file."""
 
@@ -22,7 +23,7 @@ class UploadFileResponse:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "UploadFileResponse":
-        inner = data.get("data", {})
+        inner = data.get("data") or {}
         return cls(
             code=data.get("code", 0),
             message=data.get("message", ""),
@@ -38,7 +39,8 @@ class UploadFileResponse:
         )
 
 
-@dataclass(frozen=True)
+@final
+@dataclass(frozen=True, slots=True)
 class DeleteFileResponse:
     """Represents a response payload from deleting a file."""
 
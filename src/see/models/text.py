@@ -1,11 +1,14 @@
 """Data models for Text Sharing operations."""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, final
 
+from .base import CodeDataMessageResponse, RequestModel
 
-@dataclass(frozen=True)
-class CreateTextRequest:
+
+@final
+@dataclass(frozen=True, slots=True)
+class CreateTextRequest(RequestModel):
     """Represents a request payload to create a text sharing."""
 
     content: str
@@ -19,7 +22,8 @@ class CreateTextRequest:
         )
 
 
-@dataclass(frozen=True)
+@final
+@dataclass(frozen=True, slots=True)
 class CreateTextResponse:
     """Represents a response payload from creating a text sharing."""
 
@@ -31,7 +35,7 @@ class CreateTextResponse:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CreateTextResponse":
-        inner_data = data.get("data", {})
+        inner_data = data.get("data") or {}
         return cls(
             code=data.get("code", 0),
             custom_slug=inner_data.get("custom_slug", ""),
@@ -41,8 +45,9 @@ class CreateTextResponse:
         )
 
 
-@dataclass(frozen=True)
-class UpdateTextRequest:
+@final
+@dataclass(frozen=True, slots=True)
+class UpdateTextRequest(RequestModel):
     """Represents a request payload to update a text sharing."""
 
     content: str
@@ -60,25 +65,19 @@ class UpdateTextRequest:
         )
 
 
-@dataclass(frozen=True)
-class UpdateTextResponse:
+@final
+@dataclass(frozen=True, slots=True)
+class UpdateTextResponse(CodeDataMessageResponse):
     """Represents a response payload from updating a text sharing."""
 
     code: int
     message: str
     data: dict[str, Any]
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "UpdateTextResponse":
-        return cls(
-            code=data.get("code", 0),
-            message=data.get("message", ""),
-            data=data.get("data", {}),
-        )
-
 
-@dataclass(frozen=True)
-class DeleteTextRequest:
+@final
+@dataclass(frozen=True, slots=True)
+class DeleteTextRequest(RequestModel):
     """Represents a request payload to delete a text sharing."""
 
     domain: str
@@ -92,18 +91,11 @@ class DeleteTextRequest:
         )
 
 
-@dataclass(frozen=True)
-class DeleteTextResponse:
+@final
+@dataclass(frozen=True, slots=True)
+class DeleteTextResponse(CodeDataMessageResponse):
     """Represents a response payload from deleting a text sharing."""
 
     code: int
     message: str
     data: dict[str, Any]
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "DeleteTextResponse":
-        return cls(
-            code=data.get("code", 0),
-            message=data.get("message", ""),
-            data=data.get("data", {}),
-        )
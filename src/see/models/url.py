@@ -1,11 +1,15 @@
 """Data models for Short URL operations."""
 
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, final
 
+from ..exceptions import ValidationError
+from .base import CodeDataMessageResponse, RequestModel
 
-@dataclass(frozen=True)
-class CreateShortUrlRequest:
+
+@final
+@dataclass(frozen=True, slots=True)
+class CreateShortUrlRequest(RequestModel):
     """Represents a request payload to create/shorten a URL."""
 
     domain: str
@@ -15,43 +19,47 @@ class CreateShortUrlRequest:
     password: str = ""
     title: str = ""
     custom_slug: str = ""
-    tag_ids: list[int] = field(default_factory=list)
+    tag_ids: tuple[int, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Reject requests the API would refuse, once at construction."""
+        target_url = self.target_url
+        # Check https first: it is by far the most common scheme
+        if not (target_url.startswith("https://") or target_url.startswith("http://")):
+            raise ValidationError("Invalid URL: must start with http:// or https://")
+
+        if not self.domain:
+            raise ValidationError("Domain is required")
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CreateShortUrlRequest":
         """Create a CreateShortUrlRequest instance from a dictionary."""
+        g = data.get
         return cls(
-            domain=data.get("domain", ""),
-            target_url=data.get("target_url", ""),
-            custom_slug=data.get("custom_slug", ""),
-            expiration_redirect_url=data.get("expiration_redirect_url", ""),
-            expire_at=data.get("expire_at", 0),
-            password=data.get("password", ""),
-            tag_ids=data.get("tag_ids", []),
-            title=data.get("title", ""),
+            domain=g("domain", ""),
+            target_url=g("target_url", ""),
+            custom_slug=g("custom_slug", ""),
+            expiration_redirect_url=g("expiration_redirect_url", ""),
+            expire_at=g("expire_at", 0),
+            password=g("password", ""),
+            tag_ids=tuple(g("tag_ids", ())),
+            title=g("title", ""),
         )
 
 
-@dataclass(frozen=True)
-class CreateShortUrlResponse:
+@final
+@dataclass(frozen=True, slots=True)
+class CreateShortUrlResponse(CodeDataMessageResponse):
     """Represents a response payload from creating a shortened URL."""
 
     code: int
     data: dict[str, Any]
     message: str
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "CreateShortUrlResponse":
-        """Create a CreateShortUrlResponse instance from a dictionary."""
-        return cls(
-            code=data.get("code", 0),
-            data=data.get("data", {}),
-            message=data.get("message", ""),
-        )
-
 
-@dataclass(frozen=True)
-class UpdateShortUrlRequest:
+@final
+@dataclass(frozen=True, slots=True)
+class UpdateShortUrlRequest(RequestModel):
     """Represents a request payload to update a shortened URL."""
 
     domain: str
@@ -62,34 +70,30 @@ class UpdateShortUrlRequest:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "UpdateShortUrlRequest":
         """Create an UpdateShortUrlRequest instance from a dictionary."""
+        g = data.get
         return cls(
-            domain=data.get("domain", ""),
-            slug=data.get("slug", ""),
-            target_url=data.get("target_url", ""),
-            title=data.get("title", ""),
+            domain=g("domain", ""),
+            slug=g("slug", ""),
+            target_url=g("target_url", ""),
+            title=g("title", ""),
         )
 
 
-@dataclass(frozen=True)
-class UpdateShortUrlResponse:
+@final
+@dataclass(frozen=True, slots=True)
+class UpdateShortUrlResponse(CodeDataMessageResponse):
     """Represents a response payload from updating a shortened URL."""
 
     code: int
     data: str = ""
     message: str = ""
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "UpdateShortUrlResponse":
-        """Create an UpdateShortUrlResponse instance from a dictionary."""
-        return cls(
-            code=data.get("code", 0),
-            data=data.get("data", ""),
-            message=data.get("message", ""),
-        )
+    _empty_data = str
 
 
-@dataclass(frozen=True)
-class DeleteShortUrlRequest:
+@final
+@dataclass(frozen=True, slots=True)
+class DeleteShortUrlRequest(RequestModel):
     """Represents a request payload to delete a shortened URL."""
 
     domain: str
@@ -98,25 +102,20 @@ class DeleteShortUrlRequest:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DeleteShortUrlRequest":
         """Create a DeleteShortUrlRequest instance from a dictionary."""
+        g = data.get
         return cls(
-            domain=data.get("domain", ""),
-            slug=data.get("slug", ""),
+            domain=g("domain", ""),
+            slug=g("slug", ""),
         )
 
 
-@dataclass(frozen=True)
-class DeleteShortUrlResponse:
+@final
+@dataclass(frozen=True, slots=True)
+class DeleteShortUrlResponse(CodeDataMessageResponse):
     """Represents a response payload from deleting a shortened URL."""
 
     code: int
     data: str = ""
     message: str = ""
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "DeleteShortUrlResponse":
-        """Create a DeleteShortUrlResponse instance from a dictionary."""
-        return cls(
-            code=data.get("code", 0),
-            data=data.get("data", ""),
-            message=data.get("message", ""),
-        )
+    _empty_data = str
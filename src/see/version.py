@@ -1,15 +1,5 @@
-try:
-    from importlib.metadata import PackageNotFoundError, version
+"""Version information for SEE SDK."""
 
-    __version__ = version("see-sdk")
-except ImportError:
-    # Fallback for Python < 3.8
-    try:
-        from importlib_metadata import PackageNotFoundError, version  # type: ignore
-
-        __version__ = version("see-sdk")
-    except ImportError:
-        __version__ = "unknown"
-except PackageNotFoundError:
-    # Package is not installed
-    __version__ = "unknown"
+# Single source of truth for the package version: pyproject.toml reads it
+# from here at build time, so importing the SDK needs no metadata lookup.
+__version__ = "1.1.1"
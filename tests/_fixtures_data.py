@@ -0,0 +1,35 @@
+"""Canned API payloads and the models they parse to, shared across tests."""
+
+from see.models import DomainResponse, TagResponse
+
+MOCK_DOMAIN_DICT = {
+    "code": 200,
+    "data": {"domains": ["example.com", "short.link", "my.link"]},
+    "message": "Success",
+}
+DOMAIN_RESPONSE = DomainResponse(
+    code=200,
+    data={"domains": ["example.com", "short.link", "my.link"]},
+    message="Success",
+)
+
+MOCK_TAG_DICT = {
+    "code": 200,
+    "data": {
+        "tags": [
+            {"id": 1, "name": "Marketing"},
+            {"id": 2, "name": "Sales"},
+        ]
+    },
+    "message": "Success",
+}
+TAG_RESPONSE = TagResponse(
+    code=200,
+    data={
+        "tags": [
+            {"id": 1, "name": "Marketing"},
+            {"id": 2, "name": "Sales"},
+        ]
+    },
+    message="Success",
+)
@@ -0,0 +1,40 @@
+"""Wire SDK clients to an httpx MockTransport, shared across tests."""
+
+import contextlib
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from typing import Any
+
+import httpx
+
+from see.client import SeeClient
+from see.http_client import HttpClient
+
+Handler = Callable[[httpx.Request], Any]
+# Types of the factories returned by the conftest fixtures of the same name
+MockTransportClient = Callable[..., AbstractAsyncContextManager[SeeClient]]
+MockHttpClient = Callable[..., AbstractAsyncContextManager[HttpClient]]
+
+
+@contextlib.asynccontextmanager
+async def mock_transport(
+    http_client: HttpClient, handler: Handler
+) -> AsyncIterator[None]:
+    """Answer ``http_client``'s requests with ``handler`` until the block exits.
+
+    The pool is still built lazily on the first request, with the client's own
+    timeout, limits and headers, but over an httpx MockTransport.
+    """
+    kwargs = {
+        k: v
+        for k, v in http_client._client_kwargs.items()
+        if k not in ("http2", "proxy")
+    }
+    transport = httpx.MockTransport(handler)
+    http_client._build_client = lambda: httpx.AsyncClient(  # type: ignore[method-assign]
+        **kwargs, transport=transport
+    )
+    try:
+        yield
+    finally:
+        await http_client.aclose()
@@ -1,21 +1,91 @@
 """Shared test fixtures and configuration."""
 
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import DEFAULT, AsyncMock, Mock
+
 import pytest
+import pytest_asyncio
+from pytest_mock import MockerFixture
 
+from see.client import SeeClient
+from see.http_client import HttpClient
+from tests._mock_transport import (
+    Handler,
+    MockHttpClient,
+    MockTransportClient,
+    mock_transport,
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def api_key() -> str:
     """Return a test API key."""
     return "test-api-key-12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_url() -> str:
     """Return a test base URL."""
     return "https://api.test.see.url"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_url() -> str:
     """Return a sample URL for testing."""
     return "https://example.com/very/long/url/path"
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_client(api_key: str, base_url: str) -> AsyncIterator[SeeClient]:
+    """Return one entered SeeClient shared by the whole test session."""
+    async with SeeClient(api_key=api_key, base_url=base_url) as client:
+        yield client
+
+
+@pytest.fixture
+def client(session_client: SeeClient) -> SeeClient:
+    """Return the shared SeeClient with its lookup cache cleared."""
+    session_client._domain_cache.clear()
+    return session_client
+
+
+@pytest.fixture
+def http_mock(client: SeeClient, mocker: MockerFixture) -> Mock:
+    """Replace the shared client's HTTP verbs with AsyncMocks for one test."""
+    patches = mocker.patch.multiple(
+        client._http_client,
+        get=DEFAULT,
+        post=DEFAULT,
+        put=DEFAULT,
+        delete=DEFAULT,
+        new_callable=AsyncMock,
+    )
+    return Mock(spec_set=list(patches), **patches)
+
+
+@pytest.fixture
+def mock_transport_client(api_key: str, base_url: str) -> MockTransportClient:
+    """Return a factory for SeeClients whose requests are answered by a handler."""
+
+    @contextlib.asynccontextmanager
+    async def factory(handler: Handler, **kwargs: Any) -> AsyncIterator[SeeClient]:
+        client = SeeClient(api_key=api_key, base_url=base_url, **kwargs)
+        async with mock_transport(client._http_client, handler):
+            yield client
+
+    return factory
+
+
+@pytest.fixture
+def mock_http_client(api_key: str, base_url: str) -> MockHttpClient:
+    """Return a factory for HttpClients whose requests are answered by a handler."""
+
+    @contextlib.asynccontextmanager
+    async def factory(handler: Handler, **kwargs: Any) -> AsyncIterator[HttpClient]:
+        client = HttpClient(api_key=api_key, base_url=base_url, **kwargs)
+        async with mock_transport(client, handler):
+            yield client
+
+    return factory
@@ -1,14 +1,36 @@
 """Tests for the main SeeClient."""
 
+import subprocess
+import sys
+from unittest.mock import AsyncMock, Mock
+
+import httpx
 import pytest
 from pytest_mock import MockerFixture
 
 from see.client import SeeClient
 from see.exceptions import ValidationError
+from see.http_client import DNS_CACHE_TTL
 from see.models import (
     DomainResponse,
     TagResponse,
 )
+from tests._fixtures_data import (
+    DOMAIN_RESPONSE,
+    MOCK_DOMAIN_DICT,
+    MOCK_TAG_DICT,
+    TAG_RESPONSE,
+)
+
+
+def test_package_exports_are_lazy() -> None:
+    """Test `import see` defers loading the client until it is accessed."""
+    code = (
+        "import sys, see; "
+        "assert 'see.client' not in sys.modules; "
+        "assert see.SeeClient.__module__ == 'see.client'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
 
 
 class TestSeeClient:
@@ -20,70 +42,156 @@ class TestSeeClient:
         assert client is not None
         assert client._http_client is not None
 
+    def test_client_connection_pool_limits(self, api_key: str, base_url: str) -> None:
+        """Test connection pool limits are forwarded to the HTTP client."""
+        client = SeeClient(
+            api_key=api_key,
+            base_url=base_url,
+            max_keepalive_connections=5,
+            max_connections=10,
+            keepalive_expiry=15.0,
+        )
+        limits = client._http_client.limits
+        assert limits.max_keepalive_connections == 5
+        assert limits.max_connections == 10
+        assert limits.keepalive_expiry == 15.0
+
+    @pytest.mark.asyncio
+    async def test_client_http2(
+        self, api_key: str, base_url: str, mocker: MockerFixture
+    ) -> None:
+        """Test HTTP/2 is enabled on the httpx transport by default."""
+        client_cls = mocker.patch("httpx.AsyncClient", wraps=httpx.AsyncClient)
+
+        async with SeeClient(api_key=api_key, base_url=base_url):
+            pass
+
+        assert client_cls.call_args.kwargs["http2"] is True
+
+    @pytest.mark.validation
+    def test_client_invalid_transport(self, api_key: str) -> None:
+        """Test client initialization fails with an unknown transport."""
+        with pytest.raises(ValidationError, match="Unsupported transport"):
+            SeeClient(api_key=api_key, transport="curl")  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_client_aiohttp_transport(
+        self, api_key: str, base_url: str, mocker: MockerFixture
+    ) -> None:
+        """Test the aiohttp transport is wired into the HTTP client."""
+        httpx_aiohttp = pytest.importorskip("httpx_aiohttp")
+        import aiohttp
+
+        connector_cls = mocker.patch("aiohttp.TCPConnector", wraps=aiohttp.TCPConnector)
+
+        async with SeeClient(
+            api_key=api_key, base_url=base_url, transport="aiohttp"
+        ) as client:
+            http_client = client._http_client._client
+            assert http_client is not None
+            transport = http_client._transport
+            assert isinstance(transport, httpx_aiohttp.AiohttpTransport)
+
+            session = transport.get_client()
+            assert session.connector is not None
+            assert session.connector.use_dns_cache
+            assert connector_cls.call_args.kwargs["ttl_dns_cache"] == DNS_CACHE_TTL
+            await session.close()
+
+    @pytest.mark.asyncio
+    async def test_client_aclose(self, api_key: str, base_url: str) -> None:
+        """Test aclose releases the connection pool and re-entry reopens it."""
+        client = SeeClient(api_key=api_key, base_url=base_url)
+        async with client:
+            assert client._http_client._client is not None
+        assert client._http_client._client is None
+
+        async with client:
+            assert client._http_client._client is not None
+        await client.aclose()
+        assert client._http_client._client is None
+
+    @pytest.mark.validation
     def test_client_initialization_without_api_key(self) -> None:
         """Test client initialization fails without API key."""
         with pytest.raises(ValidationError, match="API key is required"):
             SeeClient(api_key="")
 
+    @pytest.mark.validation
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_client_invalid_request_concurrency(self, api_key: str, limit: int) -> None:
+        """Test client initialization fails with a request limit below one."""
+        with pytest.raises(ValidationError, match="max_concurrent_requests"):
+            SeeClient(api_key=api_key, max_concurrent_requests=limit)
+
+    @pytest.mark.validation
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_client_invalid_upload_concurrency(self, api_key: str, limit: int) -> None:
+        """Test client initialization fails with an upload limit below one."""
+        with pytest.raises(ValidationError, match="max_concurrent_uploads"):
+            SeeClient(api_key=api_key, max_concurrent_uploads=limit)
+
+    @pytest.mark.happy_path
     @pytest.mark.asyncio
     async def test_get_domains(
         self,
-        api_key: str,
-        base_url: str,
-        mocker: MockerFixture,
+        client: SeeClient,
+        http_mock: Mock,
     ) -> None:
         """Test retrieving available domains."""
-        mock_response = {
-            "code": 200,
-            "data": {"domains": ["example.com", "short.link", "my.link"]},
-            "message": "Success",
-        }
-
-        async with SeeClient(api_key=api_key, base_url=base_url) as client:
-            mock_get = mocker.patch.object(
-                client._http_client,
-                "get",
-                return_value=mock_response,
-            )
-
-            result = await client.get_domains()
-
-            assert isinstance(result, DomainResponse)
-            assert result.code == 200
-            assert "domains" in result.data
-            assert len(result.data["domains"]) == 3
-            mock_get.assert_called_once_with("/v1/domains")
+        http_mock.get.return_value = MOCK_DOMAIN_DICT
 
+        result = await client.get_domains()
+
+        assert type(result) is DomainResponse
+        assert result == DOMAIN_RESPONSE
+        http_mock.get.assert_called_once_with("/v1/domains")
+
+    @pytest.mark.happy_path
     @pytest.mark.asyncio
     async def test_get_tags(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
+    ) -> None:
+        """Test retrieving available tags."""
+        http_mock.get.return_value = MOCK_TAG_DICT
+
+        result = await client.get_tags()
+
+        assert type(result) is TagResponse
+        assert result == TAG_RESPONSE
+        http_mock.get.assert_called_once_with("/v1/tags")
+
+    @pytest.mark.asyncio
+    async def test_get_domains_cached(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
+    ) -> None:
+        """Test repeated domain lookups are served from the cache."""
+        http_mock.get.return_value = MOCK_DOMAIN_DICT
+
+        first = await client.get_domains()
+        second = await client.get_domains()
+
+        assert first is second
+        http_mock.get.assert_called_once_with("/v1/domains")
+
+    @pytest.mark.asyncio
+    async def test_get_domains_cache_disabled(
         self,
         api_key: str,
         base_url: str,
-        mocker: MockerFixture,
     ) -> None:
-        """Test retrieving available tags."""
-        mock_response = {
-            "code": 200,
-            "data": {
-                "tags": [
-                    {"id": 1, "name": "Marketing"},
-                    {"id": 2, "name": "Sales"},
-                ]
-            },
-            "message": "Success",
-        }
-
-        async with SeeClient(api_key=api_key, base_url=base_url) as client:
-            mock_get = mocker.patch.object(
-                client._http_client,
-                "get",
-                return_value=mock_response,
-            )
-
-            result = await client.get_tags()
-
-            assert isinstance(result, TagResponse)
-            assert result.code == 200
-            assert "tags" in result.data
-            assert len(result.data["tags"]) == 2
-            mock_get.assert_called_once_with("/v1/tags")
+        """Test a zero TTL disables the domain cache."""
+        client = SeeClient(api_key=api_key, base_url=base_url, domain_cache_ttl=0)
+        # Patched before any request, so no underlying HTTP client is built
+        mock_get = AsyncMock(return_value=MOCK_DOMAIN_DICT)
+        client._http_client.get = mock_get  # type: ignore[method-assign]
+
+        await client.get_domains()
+        await client.get_domains()
+
+        assert mock_get.call_count == 2
+        assert client._http_client._client is None
@@ -0,0 +1,361 @@
+"""Tests for the Text and Short URL CRUD operations."""
+
+import asyncio
+import json
+import re
+from typing import Any
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from see.client import SeeClient
+from see.exceptions import APIError, ValidationError
+from see.models import (
+    CreateShortUrlRequest,
+    CreateShortUrlResponse,
+    CreateTextRequest,
+    CreateTextResponse,
+    DeleteShortUrlRequest,
+    DeleteShortUrlResponse,
+    DeleteTextRequest,
+    DeleteTextResponse,
+    DomainResponse,
+    UpdateShortUrlRequest,
+    UpdateShortUrlResponse,
+    UpdateTextRequest,
+    UpdateTextResponse,
+)
+from tests._mock_transport import MockTransportClient
+
+_INVALID_URL_RE = re.compile("Invalid URL")
+_DOMAIN_REQUIRED_RE = re.compile("Domain is required")
+
+# Canned API payloads; shared between tests, so never mutate them
+_CREATE_TEXT_RESP = {
+    "code": 0,
+    "data": {
+        "custom_slug": "slug123",
+        "short_url": "https://s.ee/t/slug123",
+        "slug": "slug123",
+    },
+    "message": "success",
+}
+_UPDATE_TEXT_RESP = {
+    "code": 0,
+    "data": {"something": "here"},
+    "message": "success",
+}
+_DELETE_TEXT_RESP = {
+    "code": 0,
+    "data": {},
+    "message": "success",
+}
+_TEXT_DOMAINS_RESP = {
+    "code": 0,
+    "data": {"domains": ["s.ee", "example.com"]},
+    "message": "success",
+}
+_CREATE_URL_RESP = {
+    "code": 200,
+    "data": {
+        "short_url": "https://example.com/abc123",
+        "slug": "abc123",
+    },
+    "message": "Success",
+}
+_CUSTOM_SLUG_URL_RESP = {
+    "code": 200,
+    "data": {
+        "short_url": "https://example.com/custom",
+        "slug": "custom",
+    },
+    "message": "Success",
+}
+_UPDATE_URL_RESP = {
+    "code": 200,
+    "data": None,
+    "message": "Updated successfully",
+}
+_DELETE_URL_RESP = {
+    "code": 200,
+    "data": None,
+    "message": "Deleted successfully",
+}
+
+
+# Request models are immutable, so each is built once at import
+_BULK_REQUESTS = tuple(
+    CreateShortUrlRequest(
+        domain="example.com",
+        target_url=f"https://example.com/{n}",
+        custom_slug=slug,
+    )
+    for n, slug in enumerate(("one", "taken", "three"), start=1)
+)
+
+# (client method, HTTP verb, path, request, payload, expected response)
+_CRUD_CASES = [
+    pytest.param(
+        "create_text",
+        "post",
+        "/v1/text",
+        CreateTextRequest(content="Hello World", title="My Text"),
+        _CREATE_TEXT_RESP,
+        CreateTextResponse(
+            code=0,
+            custom_slug="slug123",
+            short_url="https://s.ee/t/slug123",
+            slug="slug123",
+            message="success",
+        ),
+        id="text-create",
+    ),
+    pytest.param(
+        "update_text",
+        "put",
+        "/v1/text",
+        UpdateTextRequest(
+            content="Updated World",
+            domain="s.ee",
+            slug="slug123",
+            title="My Text Updated",
+        ),
+        _UPDATE_TEXT_RESP,
+        UpdateTextResponse(code=0, message="success", data={"something": "here"}),
+        id="text-update",
+    ),
+    pytest.param(
+        "delete_text",
+        "delete",
+        "/v1/text",
+        DeleteTextRequest(domain="s.ee", slug="slug123"),
+        _DELETE_TEXT_RESP,
+        DeleteTextResponse(code=0, message="success", data={}),
+        id="text-delete",
+    ),
+    pytest.param(
+        "create_short_url",
+        "post",
+        "/v1/shorten",
+        CreateShortUrlRequest(
+            domain="example.com", target_url="https://www.google.com"
+        ),
+        _CREATE_URL_RESP,
+        CreateShortUrlResponse(
+            code=200,
+            data={"short_url": "https://example.com/abc123", "slug": "abc123"},
+            message="Success",
+        ),
+        id="url-create",
+    ),
+    pytest.param(
+        "create_short_url",
+        "post",
+        "/v1/shorten",
+        CreateShortUrlRequest(
+            domain="example.com",
+            target_url="https://www.google.com",
+            custom_slug="custom",
+            title="Test Link",
+            expire_at=1735689599,
+            tag_ids=(1, 2),
+        ),
+        _CUSTOM_SLUG_URL_RESP,
+        CreateShortUrlResponse(
+            code=200,
+            data={"short_url": "https://example.com/custom", "slug": "custom"},
+            message="Success",
+        ),
+        id="url-create-custom-slug",
+    ),
+    pytest.param(
+        "update_short_url",
+        "put",
+        "/v1/shorten",
+        UpdateShortUrlRequest(
+            domain="example.com",
+            slug="abc123",
+            target_url="https://example.org/new",
+            title="Updated Title",
+        ),
+        _UPDATE_URL_RESP,
+        UpdateShortUrlResponse(code=200, message="Updated successfully"),
+        id="url-update",
+    ),
+    pytest.param(
+        "delete_short_url",
+        "delete",
+        "/v1/shorten",
+        DeleteShortUrlRequest(domain="example.com", slug="abc123"),
+        _DELETE_URL_RESP,
+        DeleteShortUrlResponse(code=200, message="Deleted successfully"),
+        id="url-delete",
+    ),
+]
+
+
+class TestCrudResources:
+    """Tests for the CRUD operations shared by every resource."""
+
+    @pytest.mark.happy_path
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("method", "verb", "path", "request_obj", "payload", "expected"), _CRUD_CASES
+    )
+    async def test_resource_crud(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
+        method: str,
+        verb: str,
+        path: str,
+        request_obj: Any,
+        payload: dict[str, Any],
+        expected: Any,
+    ) -> None:
+        """Test each operation sends its request and parses the response."""
+        verb_mock = getattr(http_mock, verb)
+        verb_mock.return_value = payload
+
+        result = await getattr(client, method)(request_obj)
+
+        assert type(result) is type(expected)
+        assert result == expected
+        verb_mock.assert_called_once_with(path, json=request_obj)
+
+    @pytest.mark.happy_path
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("method", "verb", "path", "request_obj", "payload", "expected"), _CRUD_CASES
+    )
+    async def test_resource_crud_over_wire(
+        self,
+        mock_transport_client: MockTransportClient,
+        method: str,
+        verb: str,
+        path: str,
+        request_obj: Any,
+        payload: dict[str, Any],
+        expected: Any,
+    ) -> None:
+        """Test each operation round-trips real JSON bytes through HttpClient."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json=payload)
+
+        async with mock_transport_client(handler) as client:
+            result = await getattr(client, method)(request_obj)
+
+        assert type(result) is type(expected)
+        assert result == expected
+        (request,) = sent
+        assert request.method == verb.upper()
+        assert request.url.path == path
+        # Round-trip the expected body too, since tuples go out as JSON arrays
+        assert json.loads(request.content) == json.loads(
+            json.dumps(request_obj.to_dict())
+        )
+
+
+class TestSeeClientText:
+    """Tests for SeeClient Text functionalities."""
+
+    @pytest.mark.happy_path
+    @pytest.mark.asyncio
+    async def test_get_text_domains(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
+    ) -> None:
+        """Test getting text domains."""
+        http_mock.get.return_value = _TEXT_DOMAINS_RESP
+
+        result = await client.get_text_domains()
+
+        assert type(result) is DomainResponse
+        assert result.code == 0
+        assert "s.ee" in result.data["domains"]
+        assert http_mock.get.call_count == 1
+
+
+class TestShortUrl:
+    """Tests for Short URL operations."""
+
+    @pytest.mark.validation
+    def test_create_short_url_invalid_target_url(self) -> None:
+        """Test a request with an invalid target URL raises ValidationError."""
+        with pytest.raises(ValidationError, match=_INVALID_URL_RE):
+            CreateShortUrlRequest(domain="example.com", target_url="not-a-valid-url")
+
+    @pytest.mark.validation
+    def test_create_short_url_missing_domain(self) -> None:
+        """Test a request without domain raises ValidationError."""
+        with pytest.raises(ValidationError, match=_DOMAIN_REQUIRED_RE):
+            CreateShortUrlRequest(domain="", target_url="https://www.google.com")
+
+    @pytest.mark.happy_path
+    @pytest.mark.asyncio
+    async def test_bulk_create_short_url(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
+    ) -> None:
+        """Test bulk creation keeps order and returns per-request errors."""
+
+        async def post(path: str, json: CreateShortUrlRequest) -> dict[str, Any]:
+            if json.custom_slug == "taken":
+                raise APIError("API request failed: 400", 400)
+            return {"code": 200, "data": {"slug": json.custom_slug}, "message": ""}
+
+        http_mock.post.side_effect = post
+
+        results = await client.bulk_create_short_url(_BULK_REQUESTS, concurrency=2)
+
+        assert type(results[0]) is CreateShortUrlResponse
+        assert results[0].data["slug"] == "one"
+        assert isinstance(results[1], APIError)
+        assert type(results[2]) is CreateShortUrlResponse
+        assert results[2].data["slug"] == "three"
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_short_url_cancelled(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
+    ) -> None:
+        """Test cancelling a bulk creation cancels its in-flight requests."""
+        entered = cancelled = 0
+
+        async def post(path: str, json: CreateShortUrlRequest) -> dict[str, Any]:
+            nonlocal entered, cancelled
+            entered += 1
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return {}
+
+        http_mock.post.side_effect = post
+
+        task = asyncio.create_task(client.bulk_create_short_url(_BULK_REQUESTS))
+        while entered < len(_BULK_REQUESTS):
+            await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled == len(_BULK_REQUESTS)
+
+    @pytest.mark.validation
+    @pytest.mark.asyncio
+    async def test_bulk_create_short_url_invalid_concurrency(
+        self,
+        client: SeeClient,
+    ) -> None:
+        """Test bulk creation rejects a concurrency below one."""
+        with pytest.raises(ValidationError, match="concurrency"):
+            await client.bulk_create_short_url([], concurrency=0)
@@ -1,25 +1,31 @@
 """Tests for SeeClient File functionalities."""
 
+from email.parser import BytesParser
+from unittest.mock import Mock
+
+import httpx
 import pytest
 from pytest_mock import MockerFixture
 
 from see.client import SeeClient
+from see.exceptions import ValidationError
 from see.models import (
     DeleteFileResponse,
     DomainResponse,
     UploadFileResponse,
 )
+from tests._mock_transport import MockTransportClient
 
 
 class TestSeeClientFile:
     """Tests for SeeClient File functionalities."""
 
+    @pytest.mark.happy_path
     @pytest.mark.asyncio
     async def test_upload_file(
         self,
-        api_key: str,
-        base_url: str,
-        mocker: MockerFixture,
+        client: SeeClient,
+        http_mock: Mock,
         tmp_path,
     ) -> None:
         """Test uploading a file."""
@@ -45,31 +51,110 @@ class TestSeeClientFile:
         p = d / "test.txt"
         p.write_text("content")
 
-        async with SeeClient(api_key=api_key, base_url=base_url) as client:
-            mock_post = mocker.patch.object(
-                client._http_client,
-                "post",
-                return_value=mock_response,
-            )
+        http_mock.post.return_value = mock_response
 
-            result = await client.upload_file(str(p))
+        result = await client.upload_file(str(p))
 
-            assert isinstance(result, UploadFileResponse)
-            assert result.code == 0
-            assert result.file_id == 123
-            assert result.hash == "hash123"
-            mock_post.assert_called_once()
+        assert type(result) is UploadFileResponse
+        assert result.code == 0
+        assert result.file_id == 123
+        assert result.hash == "hash123"
+        assert http_mock.post.call_count == 1
 
-            # Verify called kwargs
-            _args, kwargs = mock_post.call_args
-            assert "files" in kwargs
+        # Verify called kwargs
+        _args, kwargs = http_mock.post.call_args
+        assert "files" in kwargs
+        assert kwargs["files"]["file"] == ("test.txt", b"content")
 
+    @pytest.mark.happy_path
     @pytest.mark.asyncio
-    async def test_delete_file(
+    async def test_upload_large_file_streams_from_disk(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
+        mocker: MockerFixture,
+        tmp_path,
+    ) -> None:
+        """Test files above the threshold are streamed instead of read whole."""
+        mocker.patch("see.api.file.STREAM_UPLOAD_THRESHOLD", 4)
+        p = tmp_path / "large.bin"
+        p.write_bytes(b"0123456789")
+
+        http_mock.post.return_value = {"code": 0, "data": {}, "message": "success"}
+
+        await client.upload_file(str(p))
+
+        _args, kwargs = http_mock.post.call_args
+        assert "files" not in kwargs
+        assert kwargs["headers"]["Content-Type"].startswith("multipart/form-data")
+        assert hasattr(kwargs["content"], "__aiter__")
+
+    @pytest.mark.happy_path
+    @pytest.mark.asyncio
+    async def test_upload_large_file_multipart_body(
         self,
-        api_key: str,
-        base_url: str,
+        mock_transport_client: MockTransportClient,
         mocker: MockerFixture,
+        tmp_path,
+    ) -> None:
+        """Test the streamed body is a valid multipart upload of the file."""
+        mocker.patch("see.api.file.STREAM_UPLOAD_THRESHOLD", 4)
+        mocker.patch("see.api.file.UPLOAD_CHUNK_SIZE", 3)
+        p = tmp_path / "large.bin"
+        p.write_bytes(b"0123456789")
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"code": 0, "data": {}, "message": ""})
+
+        async with mock_transport_client(handler) as client:
+            await client.upload_file(p, filename='my "large".bin')
+
+        (request,) = sent
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        message = BytesParser().parsebytes(
+            b"Content-Type: "
+            + request.headers["Content-Type"].encode()
+            + b"\r\n\r\n"
+            + request.content
+        )
+        (part,) = message.get_payload()
+        assert part.get_param("name", header="Content-Disposition") == "file"
+        assert part.get_filename() == "my %22large%22.bin"
+        assert part.get_payload(decode=True) == b"0123456789"
+
+    @pytest.mark.happy_path
+    @pytest.mark.asyncio
+    async def test_upload_file_bytes(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
+    ) -> None:
+        """Test uploading in-memory content."""
+        http_mock.post.return_value = {"code": 0, "data": {}, "message": "success"}
+
+        await client.upload_file(b"content", filename="test.txt")
+
+        _args, kwargs = http_mock.post.call_args
+        assert kwargs["files"]["file"] == ("test.txt", b"content")
+
+    @pytest.mark.validation
+    @pytest.mark.asyncio
+    async def test_upload_file_bytes_without_filename(
+        self,
+        client: SeeClient,
+    ) -> None:
+        """Test uploading in-memory content requires a filename."""
+        with pytest.raises(ValidationError, match="Filename is required"):
+            await client.upload_file(b"content")
+
+    @pytest.mark.happy_path
+    @pytest.mark.asyncio
+    async def test_delete_file(
+        self,
+        client: SeeClient,
+        http_mock: Mock,
     ) -> None:
         """Test deleting a file."""
         mock_response = {
@@ -78,25 +163,20 @@ class TestSeeClientFile:
             "success": True,
         }
 
-        async with SeeClient(api_key=api_key, base_url=base_url) as client:
-            mock_get = mocker.patch.object(
-                client._http_client,
-                "get",
-                return_value=mock_response,
-            )
+        http_mock.get.return_value = mock_response
 
-            result = await client.delete_file("hash123")
+        result = await client.delete_file("hash123")
 
-            assert isinstance(result, DeleteFileResponse)
-            assert result.success is True
-            mock_get.assert_called_once_with("/v1/file/delete/hash123")
+        assert type(result) is DeleteFileResponse
+        assert result.success is True
+        http_mock.get.assert_called_once_with("/v1/file/delete/hash123")
 
+    @pytest.mark.happy_path
     @pytest.mark.asyncio
     async def test_get_file_domains(
         self,
-        api_key: str,
-        base_url: str,
-        mocker: MockerFixture,
+        client: SeeClient,
+        http_mock: Mock,
     ) -> None:
         """Test getting file domains."""
         mock_response = {
@@ -105,16 +185,11 @@ class TestSeeClientFile:
             "message": "success",
         }
 
-        async with SeeClient(api_key=api_key, base_url=base_url) as client:
-            mock_get = mocker.patch.object(
-                client._http_client,
-                "get",
-                return_value=mock_response,
-            )
+        http_mock.get.return_value = mock_response
 
-            result = await client.get_file_domains()
+        result = await client.get_file_domains()
 
-            assert isinstance(result, DomainResponse)
-            assert result.code == 0
-            assert "f.see" in result.data["domains"]
-            mock_get.assert_called_once()
+        assert type(result) is DomainResponse
+        assert result.code == 0
+        assert "f.see" in result.data["domains"]
+        assert http_mock.get.call_count == 1
@@ -0,0 +1,350 @@
+"""Tests for the HTTP client wrapper."""
+
+import asyncio
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+import see.http_client
+from see.exceptions import (
+    APIError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+)
+from see.http_client import BACKOFF_CAP, BACKOFF_JITTER, HttpClient, _backoff_delay
+from see.models import DeleteShortUrlRequest
+from tests._mock_transport import MockHttpClient
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    """Run a test with orjson and again with the stdlib json fallback."""
+    if request.param == "orjson":
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(see.http_client, "_dumps", orjson.dumps)
+        monkeypatch.setattr(see.http_client, "_loads", orjson.loads)
+    else:
+        monkeypatch.setattr(see.http_client, "_dumps", see.http_client._json_dumps)
+        monkeypatch.setattr(see.http_client, "_loads", see.http_client._json_loads)
+    return request.param
+
+
+class TestHttpClient:
+    """Tests for HttpClient class."""
+
+    @pytest.mark.asyncio
+    async def test_client_created_lazily(
+        self, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test the pool is opened on first request and closed by aclose."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={})
+
+        async with mock_http_client(handler) as client:
+            assert client._client is None
+
+            assert await client.get("/v1/domains") == {}
+            pooled = client._client
+            assert pooled is not None
+
+            await client.get("/v1/tags")
+            assert client._client is pooled
+
+            await client.aclose()
+            assert client._client is None
+            assert pooled.is_closed
+
+    def test_url_building(self) -> None:
+        """Test endpoint URLs are joined onto the base URL and cached."""
+        client = HttpClient(api_key="test-api-key", base_url="https://example.com/api/")
+
+        url = client._get_url("/v1/shorten")
+        assert url == httpx.URL("https://example.com/api/v1/shorten")
+        assert client._get_url("v1/shorten") == url
+        assert client._get_url("/v1/shorten") is url
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_requests(
+        self, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test no more than max_concurrent_requests are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"code": 0})
+
+        async with mock_http_client(handler, max_concurrent_requests=2) as client:
+            await asyncio.gather(*(client.get("/v1/domains") for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_json_body_encoding(
+        self, json_backend: str, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test JSON bodies are sent as compact JSON bytes."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"code": 0})
+
+        async with mock_http_client(handler) as client:
+            await client.post("/v1/text", json={"content": "hi", "tag_ids": [1, 2]})
+
+        assert requests[0].content == b'{"content":"hi","tag_ids":[1,2]}'
+        assert requests[0].headers["Content-Type"] == "application/json"
+
+    def test_unserializable_body(self, json_backend: str) -> None:
+        """Test a body neither encoder understands raises TypeError."""
+        with pytest.raises(TypeError):
+            see.http_client._dumps({"when": object()})
+
+    @pytest.mark.asyncio
+    async def test_multipart_content_type(
+        self, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test file uploads keep httpx's multipart Content-Type."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"code": 0})
+
+        async with mock_http_client(handler) as client:
+            await client.post("/v1/file/upload", files={"file": ("a.txt", b"data")})
+            await client.get("/v1/domains")
+
+        assert requests[0].headers["Content-Type"].startswith("multipart/form-data")
+        assert "Content-Type" not in requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_dataclass_body_encoding(
+        self, json_backend: str, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test request dataclasses are serialized field by field."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"code": 0})
+
+        async with mock_http_client(handler) as client:
+            body = DeleteShortUrlRequest(domain="s.ee", slug="abc")
+            await client.delete("/v1/shorten", json=body)
+
+        assert requests[0].content == b'{"domain":"s.ee","slug":"abc"}'
+
+    @pytest.mark.asyncio
+    async def test_empty_success_response(
+        self, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test a 204 No Content response is returned as an empty dict."""
+        async with mock_http_client(lambda request: httpx.Response(204)) as client:
+            assert await client.delete("/v1/file/abc") == {}
+
+    @pytest.mark.asyncio
+    async def test_non_json_error_response(
+        self, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test non-JSON error bodies are kept as raw text."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(502, text="Bad Gateway")
+
+        async with mock_http_client(handler, max_retries=1) as client:
+            with pytest.raises(APIError) as exc_info:
+                await client.get("/v1/domains")
+
+        assert exc_info.value.status_code == 502
+        assert exc_info.value.response_data == {"content": "Bad Gateway"}
+
+    @pytest.mark.parametrize(
+        ("status_code", "error_cls"),
+        [
+            (401, AuthenticationError),
+            (403, AuthenticationError),
+            (404, NotFoundError),
+            (429, RateLimitError),
+            (400, APIError),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_error_status_mapping(
+        self,
+        status_code: int,
+        error_cls: type[APIError],
+        mock_http_client: MockHttpClient,
+    ) -> None:
+        """Test error statuses raise the matching SDK exception."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(status_code, json={"message": "error"})
+
+        async with mock_http_client(handler, max_retries=1) as client:
+            with pytest.raises(error_cls) as exc_info:
+                await client.get("/v1/domains")
+
+        assert type(exc_info.value) is error_cls
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.response_data == {"message": "error"}
+
+    @pytest.mark.asyncio
+    async def test_retry_on_server_error(
+        self, mocker: MockerFixture, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test idempotent requests are retried on 5xx responses."""
+        mock_sleep = mocker.patch("see.http_client.asyncio.sleep")
+        statuses = iter([503, 502, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"code": 0})
+
+        async with mock_http_client(handler) as client:
+            result = await client.get("/v1/domains")
+
+        assert result == {"code": 0}
+        assert mock_sleep.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("attempt", "base"), [(0, 1.0), (1, 2.0), (3, 8.0), (5, 30.0), (50, 30.0)]
+    )
+    def test_backoff_delay(self, attempt: int, base: float) -> None:
+        """Test backoff doubles up to the cap with proportional jitter."""
+        for _ in range(20):
+            assert base <= _backoff_delay(attempt) <= base * (1 + BACKOFF_JITTER)
+        assert _backoff_delay(attempt, retry_after=2.5) == 2.5
+
+    @pytest.mark.asyncio
+    async def test_retry_after_header(
+        self, mocker: MockerFixture, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test the Retry-After header sets the retry delay."""
+        mock_sleep = mocker.patch("see.http_client.asyncio.sleep")
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "7"}),
+                httpx.Response(200, json={"code": 0}),
+            ]
+        )
+
+        async with mock_http_client(lambda request: next(responses)) as client:
+            await client.get("/v1/tags")
+
+        mock_sleep.assert_called_once_with(7.0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("3", 3),
+            ("inf", None),
+            ("1e400", None),
+            ("nan", None),
+            ("-5", None),
+            ("1.5", None),
+            ("Wed, 21 Oct 2026 07:28:00 GMT", None),
+        ],
+    )
+    async def test_rate_limit_after_retries(
+        self,
+        mocker: MockerFixture,
+        header: str,
+        expected: int | None,
+        mock_http_client: MockHttpClient,
+    ) -> None:
+        """Test RateLimitError carries Retry-After once retries run out."""
+        mock_sleep = mocker.patch("see.http_client.asyncio.sleep")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, headers={"Retry-After": header})
+
+        async with mock_http_client(handler) as client:
+            with pytest.raises(RateLimitError) as exc_info:
+                await client.get("/v1/tags")
+
+        assert exc_info.value.retry_after == expected
+        if expected is None:
+            # Unusable values fall back to the regular backoff schedule
+            for (delay,), _kwargs in mock_sleep.call_args_list:
+                assert 0 < delay <= BACKOFF_CAP * (1 + BACKOFF_JITTER)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status_code", "error"), [(429, RateLimitError), (503, APIError)]
+    )
+    @pytest.mark.parametrize("header", ["86400", "1" + "0" * 400])
+    async def test_long_retry_after_not_waited(
+        self,
+        mocker: MockerFixture,
+        status_code: int,
+        error: type[APIError],
+        header: str,
+        mock_http_client: MockHttpClient,
+    ) -> None:
+        """Test a Retry-After beyond the backoff cap raises instead of sleeping."""
+        mock_sleep = mocker.patch("see.http_client.asyncio.sleep")
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(status_code, headers={"Retry-After": header})
+
+        async with mock_http_client(handler) as client:
+            with pytest.raises(error) as exc_info:
+                await client.get("/v1/domains")
+
+        assert type(exc_info.value) is error
+        assert exc_info.value.status_code == status_code
+        assert calls == 1
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_on_server_error(
+        self,
+        mocker: MockerFixture,
+        mock_http_client: MockHttpClient,
+    ) -> None:
+        """Test non-idempotent requests are not retried on 5xx responses."""
+        mock_sleep = mocker.patch("see.http_client.asyncio.sleep")
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503)
+
+        async with mock_http_client(handler) as client:
+            with pytest.raises(APIError):
+                await client.post("/v1/shorten", json={})
+
+        assert calls == 1
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retry_on_connect_error(
+        self, mocker: MockerFixture, mock_http_client: MockHttpClient
+    ) -> None:
+        """Test connection failures are retried until attempts run out."""
+        mock_sleep = mocker.patch("see.http_client.asyncio.sleep")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with mock_http_client(handler, max_retries=3) as client:
+            with pytest.raises(APIError, match="after 3 attempts"):
+                await client.post("/v1/shorten", json={})
+
+        assert mock_sleep.call_count == 2
@@ -1,10 +1,13 @@
 """Tests for data models."""
 
+import dataclasses
+
 import pytest
 
 from see.models import (
     CreateShortUrlRequest,
     CreateShortUrlResponse,
+    CreateTextResponse,
     DeleteShortUrlRequest,
     DeleteShortUrlResponse,
     DomainResponse,
@@ -12,6 +15,7 @@ from see.models import (
     TagResponse,
     UpdateShortUrlRequest,
     UpdateShortUrlResponse,
+    UploadFileResponse,
 )
 
 
@@ -37,7 +41,7 @@ def test_create_short_url_request_from_dict() -> None:
     assert request.password == "secret123"
     assert request.title == "Test Link"
     assert request.custom_slug == "my-link"
-    assert request.tag_ids == [1, 2, 3]
+    assert request.tag_ids == (1, 2, 3)
 
 
 def test_create_short_url_request_minimal() -> None:
@@ -56,7 +60,7 @@ def test_create_short_url_request_minimal() -> None:
     assert request.password == ""
     assert request.title == ""
     assert request.custom_slug == ""
-    assert request.tag_ids == []
+    assert request.tag_ids == ()
 
 
 def test_create_short_url_response_from_dict() -> None:
@@ -138,6 +142,16 @@ def test_delete_short_url_response_from_dict() -> None:
     assert response.message == "Deleted successfully"
 
 
+def test_response_from_dict_null_data() -> None:
+    """Test a null data payload parses like a missing one."""
+    payload = {"code": 500, "data": None, "message": "error"}
+
+    assert CreateShortUrlResponse.from_dict(payload).data == {}
+    assert UpdateShortUrlResponse.from_dict(payload).data == ""
+    assert CreateTextResponse.from_dict(payload).slug == ""
+    assert UploadFileResponse.from_dict(payload).file_id == 0
+
+
 def test_domain_response_from_dict() -> None:
     """Test creating DomainResponse from dictionary."""
     data = {
@@ -193,6 +207,24 @@ def test_tag_response_from_dict() -> None:
     assert response.message == "Success"
 
 
+def test_request_to_dict() -> None:
+    """Test request models convert to their payload without copying fields."""
+    request = CreateShortUrlRequest(
+        domain="example.com",
+        target_url="https://example.com/target",
+        tag_ids=(1, 2),
+    )
+
+    payload = request.to_dict()
+
+    assert payload == dataclasses.asdict(request)
+    assert payload["tag_ids"] is request.tag_ids
+    assert DeleteShortUrlRequest(domain="example.com", slug="abc").to_dict() == {
+        "domain": "example.com",
+        "slug": "abc",
+    }
+
+
 def test_create_short_url_request_immutable() -> None:
     """Test that CreateShortUrlRequest is immutable (frozen dataclass)."""
     request = CreateShortUrlRequest(
@@ -210,3 +242,12 @@ def test_tag_immutable() -> None:
 
     with pytest.raises(AttributeError):
         tag.name = "Updated"  # type: ignore
+
+
+def test_models_have_no_instance_dict() -> None:
+    """Test models are slotted so instances carry no __dict__."""
+    tag = Tag(id=1, name="Test")
+    request = DeleteShortUrlRequest(domain="example.com", slug="abc")
+
+    assert not hasattr(tag, "__dict__")
+    assert not hasattr(request, "__dict__")